@@ -5,6 +5,7 @@ Uses local Hugging Face Transformers model to classify plant diseases from leaf
 
 from datetime import datetime
 import io
+from typing import BinaryIO
 import torch
 from PIL import Image
 from transformers import AutoImageProcessor, AutoModelForImageClassification
@@ -49,15 +50,18 @@ def _clean_label(label: str) -> str:
     return parts.title()
 
 
-async def analyze_image(image_bytes: bytes) -> dict:
+async def analyze_image(image_data: bytes | BinaryIO) -> dict:
     """
     Classify plant disease using local Hugging Face model.
+    Accepts raw bytes or a binary file-like object (e.g. an upload's spooled file).
     """
     try:
         model, processor = get_model()
 
-        # Load image from bytes
-        image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+        # Load image from bytes or read directly from the file object
+        if isinstance(image_data, (bytes, bytearray)):
+            image_data = io.BytesIO(image_data)
+        image = Image.open(image_data).convert("RGB")
 
         # Preprocess
         inputs = processor(images=image, return_tensors="pt")
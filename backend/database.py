@@ -1,31 +1,42 @@
 """
-SQLite database via SQLAlchemy (synchronous engine).
+SQLite database via SQLAlchemy (async engine, aiosqlite driver).
 DB file: backend/jomee.db  (auto-created on first run)
 """
 import os
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import DeclarativeBase
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "jomee.db")
-DATABASE_URL = f"sqlite:///{DB_PATH}"
+DATABASE_URL = f"sqlite+aiosqlite:///{DB_PATH}"
 
-engine = create_engine(DATABASE_URL, echo=False, connect_args={"check_same_thread": False})
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# Pooled connections are reused across requests instead of being opened per call.
+engine = create_async_engine(
+    DATABASE_URL,
+    echo=False,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_pre_ping=True,
+)
+SessionLocal = async_sessionmaker(bind=engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 
 class Base(DeclarativeBase):
     pass
 
 
-def init_db():
+async def init_db():
     """Create all tables that don't exist yet."""
     from models.db_models import FarmerProfile, CropListing, InputListing, BuyerInquiry  # noqa: F401
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def get_session():
-    db = SessionLocal()
-    try:
+async def get_db():
+    """
+    FastAPI dependency yielding one session per request.
+    FastAPI caches dependencies per request, so every Depends(get_db)
+    within a single request shares the same session/connection.
+    """
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
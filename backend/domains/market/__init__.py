@@ -5,6 +5,7 @@ from .market_analyze import (
     get_available_filters,
     get_market_records,
     resolve_coords_for_state,
+    convert_csvs_to_parquet,
 )
 from .market_signals import (
     compute_buyer_signal,
@@ -20,6 +21,7 @@ __all__ = [
     "get_available_filters",
     "get_market_records",
     "resolve_coords_for_state",
+    "convert_csvs_to_parquet",
     "compute_buyer_signal",
     "compute_price_momentum",
     "compute_trade_recommendation",
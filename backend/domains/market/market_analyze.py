@@ -6,14 +6,21 @@ Each file represents a "Region".
 
 CSV Columns: State, District, Market, Commodity, Variety, Grade,
              Arrival_Date, Min_Price, Max_Price, Modal_Price, Commodity_Code
+
+Each CSV is mirrored to a sibling .parquet file at startup (see
+convert_csvs_to_parquet); reads use the Parquet copy while it is fresh.
 """
 
 import os
 import glob
+import asyncio
+import tempfile
+import threading
 import pandas as pd
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from datetime import datetime, date
 from pathlib import Path
-from functools import lru_cache
 
 # ── CSV file location ──────────────────────────────────────────────────────
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
@@ -60,16 +67,109 @@ def resolve_coords_for_state(region_name: str) -> tuple[float, float]:
     return (10.85, 76.27) # Default
 
 
-@lru_cache(maxsize=10)
+# Parsed CSVs keyed by filename → (mtime, DataFrame); re-parsed when the file changes on disk
+_CSV_CACHE: dict[str, tuple[float, pd.DataFrame]] = {}
+_CSV_LOCK = threading.Lock()
+
+# Commodity rows sorted newest-first, keyed by (filename, commodity) → (source mtime, rows).
+# Paging then only slices; entries for a file are dropped when it is re-parsed.
+_RECORDS_CACHE: dict[tuple[str, str], tuple[float, pd.DataFrame]] = {}
+
+
 def _load_csv(filename: str) -> pd.DataFrame:
     """
     Load and cache a specific CSV file by name.
+    The cached frame is reused until the file's mtime changes.
     """
     path = DATA_DIR / filename
     if not path.exists():
         raise FileNotFoundError(f"Region file {filename} not found")
 
-    df = pd.read_csv(path)
+    mtime  = path.stat().st_mtime
+    cached = _CSV_CACHE.get(filename)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    with _CSV_LOCK:
+        # Another thread may have parsed it while we waited
+        cached = _CSV_CACHE.get(filename)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        df = _parse_csv(path)
+        _CSV_CACHE[filename] = (mtime, df)
+        # Release record slices built from the previous version of this file
+        for key in [k for k in list(_RECORDS_CACHE) if k[0] == filename]:
+            _RECORDS_CACHE.pop(key, None)
+        return df
+
+
+def _parquet_path(csv_path: Path) -> Path:
+    return csv_path.with_suffix(".parquet")
+
+
+def _parquet_is_fresh(csv_path: Path) -> bool:
+    pq_path = _parquet_path(csv_path)
+    return pq_path.exists() and pq_path.stat().st_mtime >= csv_path.stat().st_mtime
+
+
+def _parquet_is_readable(csv_path: Path) -> bool:
+    try:
+        pq.read_metadata(_parquet_path(csv_path))
+        return True
+    except Exception:
+        return False
+
+
+def _write_parquet(csv_path: Path) -> None:
+    """
+    Write the Parquet copy to a temp file and rename it into place, so
+    readers (and other workers) never see a partially written file.
+    """
+    fd, tmp = tempfile.mkstemp(dir=DATA_DIR, prefix=f".{csv_path.stem}.", suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        pq.write_table(pa_csv.read_csv(csv_path), tmp)
+        os.replace(tmp, _parquet_path(csv_path))
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def convert_csvs_to_parquet() -> int:
+    """
+    Write a Parquet copy of every region CSV whose copy is missing, older
+    than the CSV, or unreadable. Called once at startup. Returns the number
+    of files written.
+    """
+    written = 0
+    for path in glob.glob(str(DATA_DIR / "*.csv")):
+        csv_path = Path(path)
+        if _parquet_is_fresh(csv_path) and _parquet_is_readable(csv_path):
+            continue
+        try:
+            _write_parquet(csv_path)
+            written += 1
+        except Exception as e:
+            print(f"Parquet conversion failed for {csv_path.name}: {e}")
+    return written
+
+
+def _parse_csv(path: Path) -> pd.DataFrame:
+    """Read a region file (Parquet copy if fresh, else CSV) and normalise its columns, dates and prices."""
+    df = None
+    if _parquet_is_fresh(path):
+        try:
+            df = pq.read_table(_parquet_path(path)).to_pandas()
+        except Exception as e:
+            # Corrupt copy: drop it so the next startup rewrites it, and use the CSV
+            print(f"Unreadable Parquet copy for {path.name}, falling back to CSV: {e}")
+            try:
+                _parquet_path(path).unlink()
+            except OSError:
+                pass
+    if df is None:
+        df = pd.read_csv(path, engine="pyarrow")
 
     # Strip whitespace from column names
     df.columns = [c.strip() for c in df.columns]
@@ -185,7 +285,12 @@ async def get_market_data(
 ) -> dict:
     """
     Fetch market data from the specific region CSV file.
+    The pandas work runs in a worker thread to keep the event loop free.
     """
+    return await asyncio.to_thread(_sync_get_market_data, region, commodity, market)
+
+
+def _sync_get_market_data(region: str, commodity: str, market: str = "") -> dict:
     try:
         filename = f"{region}.csv"
         df = _load_csv(filename)
@@ -252,6 +357,11 @@ async def get_price_trend_series(
     market:    str = "",
     days:      int = 14,
 ) -> list[dict]:
+    """Daily median price series; runs in a worker thread like get_market_data."""
+    return await asyncio.to_thread(_sync_get_price_trend_series, region, commodity, market, days)
+
+
+def _sync_get_price_trend_series(region: str, commodity: str, market: str = "", days: int = 14) -> list[dict]:
     try:
         filename = f"{region}.csv"
         df = _load_csv(filename)
@@ -272,17 +382,37 @@ async def get_price_trend_series(
         )
         
         return [
-            {
-                "date":    row[COL_DATE].strftime("%d %b"),
-                "price":   round(float(row["price"]), 2),
-                "arrival": int(row["count"])
-            }
-            for _, row in daily.iterrows()
+            {"date": d, "price": round(p, 2), "arrival": a}
+            for d, p, a in zip(
+                daily[COL_DATE].dt.strftime("%d %b").tolist(),
+                daily["price"].astype(float).tolist(),
+                daily["count"].astype(int).tolist(),
+            )
         ]
     except Exception:
         return []
 
 
+def _sorted_records(filename: str, commodity: str) -> pd.DataFrame:
+    df    = _load_csv(filename)
+    mtime = _CSV_CACHE[filename][0]
+    key   = (filename, commodity.lower())
+    cached = _RECORDS_CACHE.get(key)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    rows = df
+    if COL_COMMODITY in rows.columns:
+        rows = rows[rows[COL_COMMODITY].str.lower() == commodity.lower()]
+    # Sort by date descending (most recent first)
+    rows = rows.sort_values(COL_DATE, ascending=False)
+
+    # Only cache commodities that exist, so arbitrary query strings can't grow the cache
+    if not rows.empty:
+        _RECORDS_CACHE[key] = (mtime, rows)
+    return rows
+
+
 def get_market_records(
     region: str,
     commodity: str,
@@ -295,18 +425,11 @@ def get_market_records(
     Arrival_Date, Min_Price, Max_Price, Modal_Price, Commodity_Code.
     """
     try:
-        filename = f"{region}.csv"
-        df = _load_csv(filename)
-
-        if COL_COMMODITY in df.columns:
-            df = df[df[COL_COMMODITY].str.lower() == commodity.lower()]
+        df = _sorted_records(f"{region}.csv", commodity)
 
         if df.empty:
             return {"records": [], "total": 0, "page": page, "page_size": page_size}
 
-        # Sort by date descending (most recent first)
-        df = df.sort_values(COL_DATE, ascending=False)
-
         total = len(df)
 
         # Paginate
@@ -314,27 +437,26 @@ def get_market_records(
         end = start + page_size
         page_df = df.iloc[start:end]
 
-        records = []
-        for _, row in page_df.iterrows():
-            arrival_date = row.get(COL_DATE)
-            if pd.notna(arrival_date):
-                arrival_date = arrival_date.strftime("%d/%m/%Y")
-            else:
-                arrival_date = "—"
-
-            records.append({
-                "state": str(row.get(COL_STATE, "—")),
-                "district": str(row.get(COL_DISTRICT, "—")),
-                "market": str(row.get(COL_MARKET, "—")),
-                "commodity": str(row.get(COL_COMMODITY, "—")),
-                "variety": str(row.get(COL_VARIETY, "Other")),
-                "grade": str(row.get(COL_GRADE, "—")),
-                "arrival_date": arrival_date,
-                "min_price": float(row.get(COL_MIN, 0) or 0),
-                "max_price": float(row.get(COL_MAX, 0) or 0),
-                "modal_price": float(row.get(COL_MODAL, 0) or 0),
-                "commodity_code": str(row.get("Commodity_Code", "—")),
-            })
+        # Build whole columns at once instead of iterating rows
+        def text(col: str, default: str) -> pd.Series | str:
+            return page_df[col].map(str) if col in page_df.columns else default
+
+        def number(col: str) -> pd.Series | float:
+            return page_df[col].astype(float) if col in page_df.columns else 0.0
+
+        records = pd.DataFrame({
+            "state": text(COL_STATE, "—"),
+            "district": text(COL_DISTRICT, "—"),
+            "market": text(COL_MARKET, "—"),
+            "commodity": text(COL_COMMODITY, "—"),
+            "variety": text(COL_VARIETY, "Other"),
+            "grade": text(COL_GRADE, "—"),
+            "arrival_date": page_df[COL_DATE].dt.strftime("%d/%m/%Y").fillna("—"),
+            "min_price": number(COL_MIN),
+            "max_price": number(COL_MAX),
+            "modal_price": number(COL_MODAL),
+            "commodity_code": text("Commodity_Code", "—"),
+        }, index=page_df.index).to_dict("records")
 
         return {
             "records": records,
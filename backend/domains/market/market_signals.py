@@ -4,6 +4,9 @@ Derives economic signals from raw market data.
 No API calls, no LLM — pure computation.
 """
 
+import numpy as np
+from utils._njit import njit
+
 
 def compute_buyer_signal(arrival: float, trend: str) -> str:
     """
@@ -22,22 +25,45 @@ def compute_buyer_signal(arrival: float, trend: str) -> str:
     return "Stable"
 
 
+@njit(cache=True)
+def _momentum_core(prices: np.ndarray) -> tuple[float, float, float, float]:
+    """
+    Numeric core of compute_price_momentum over a float64 array of prices
+    (oldest→newest, len >= 2). Returns (change_pct, avg_daily_change, high, low).
+    """
+    n     = prices.shape[0]
+    first = prices[0]
+    last  = prices[n - 1]
+    change_pct = ((last - first) / first) * 100.0 if first != 0.0 else 0.0
+
+    total = 0.0
+    high  = first
+    low   = first
+    for i in range(1, n):
+        total += abs(prices[i] - prices[i - 1])
+        if prices[i] > high:
+            high = prices[i]
+        if prices[i] < low:
+            low = prices[i]
+
+    return change_pct, total / (n - 1), high, low
+
+
 def compute_price_momentum(series: list[dict]) -> dict:
     """
     Given a list of {date, price} dicts (oldest→newest),
     compute momentum metrics for the trend chart.
     """
-    prices = [r["price"] for r in series if r.get("price", 0) > 0]
+    prices = np.ascontiguousarray(
+        [r["price"] for r in series if r.get("price", 0) > 0], dtype=np.float64
+    )
     if len(prices) < 2:
         return {"momentum": "neutral", "change_pct": 0.0, "volatility": 0.0}
 
-    first, last = prices[0], prices[-1]
-    change_pct  = round(((last - first) / first) * 100, 2) if first else 0.0
-
-    # Volatility: std-dev of daily changes
-    daily_changes = [abs(prices[i] - prices[i - 1]) for i in range(1, len(prices))]
-    avg_change    = sum(daily_changes) / len(daily_changes) if daily_changes else 0
-    volatility    = round(avg_change, 2)
+    change, avg_change, high, low = _momentum_core(prices)
+    change_pct = round(float(change), 2)
+    # Volatility: mean absolute daily change
+    volatility = round(float(avg_change), 2)
 
     momentum = "rising" if change_pct > 2 else ("falling" if change_pct < -2 else "neutral")
 
@@ -45,8 +71,8 @@ def compute_price_momentum(series: list[dict]) -> dict:
         "momentum":   momentum,
         "change_pct": change_pct,
         "volatility": volatility,
-        "high":       max(prices),
-        "low":        min(prices),
+        "high":       float(high),
+        "low":        float(low),
         "period_days": len(series),
     }
 
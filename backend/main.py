@@ -13,18 +13,26 @@ Endpoints:
   GET  /api/health                  — Health check
 """
 
+import time
+import asyncio
+import httpx
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from functools import lru_cache
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from datetime import datetime
-from database import init_db, SessionLocal
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from async_lru import alru_cache
+from cachetools import TTLCache
+from database import init_db, get_db, SessionLocal
 from models.db_models import FarmerProfile
 from models.farmer_schemas import FarmerProfileCreate, FarmerProfileResponse
 
-from agents.vision_agent import analyze_image
 from agents.climate_agent import get_climate_risk
 from agents.satellite_agent import get_satellite_health
-from agents.orchestrator import run_orchestration
 from agents.outlier_orchestrator import run_orchestration
 from domains.market import (
     get_market_data,
@@ -32,25 +40,78 @@ from domains.market import (
     get_available_filters,
     get_market_records,
     enrich_market_data,
+    compute_price_momentum,
     compute_trade_recommendation,
     to_market_summary,
     to_chart_series,
     resolve_coords_for_state,
+    convert_csvs_to_parquet,
 )
 from models.schemas import AgentInput
+from config import GROQ_API_KEY, GROQ_MODEL
 
 @asynccontextmanager
 async def lifespan(app):
-    init_db()
+    # Market endpoints run their pandas work via asyncio.to_thread; give them room
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=64))
+    await init_db()
+    # Mirror market CSVs to Parquet so cache misses skip CSV parsing
+    await asyncio.to_thread(convert_csvs_to_parquet)
+    # Compile (or load from cache) the JIT momentum kernel before serving traffic
+    compute_price_momentum([{"price": 100.0 + i} for i in range(14)])
+    # One pooled HTTP/2 client for Groq, reused across chat requests.
+    # Left unset when no API key is configured so chat fails fast.
+    app.state.groq = None
+    if GROQ_API_KEY:
+        app.state.groq = httpx.AsyncClient(
+            base_url="https://api.groq.com",
+            http2=True,
+            timeout=30.0,
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+        )
+    else:
+        print("WARNING: GROQ_API_KEY is not configured; /api/assistant/chat is disabled")
     yield
+    if app.state.groq:
+        await app.state.groq.aclose()
 
 app = FastAPI(
     title="Disease Intelligence Platform API",
     description="Multi-agent backend for plant disease detection, climate risk, and satellite health.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# ── Upload size limit ──
+# Registered before CORS so it sits inside it and 413s still carry CORS headers.
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Pure ASGI middleware rejecting oversized image uploads from Content-Length,
+    before the body is read. Other paths pass straight through.
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] == "/api/vision/analyze":
+            for name, value in scope["headers"]:
+                if name == b"content-length":
+                    if value.isdigit() and int(value) > MAX_UPLOAD_BYTES:
+                        response = ORJSONResponse({"detail": "Image exceeds the 10 MB upload limit"}, status_code=413)
+                        await response(scope, receive, send)
+                        return
+                    break
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(UploadSizeLimitMiddleware)
+
+
 # ── CORS ──
 app.add_middleware(
     CORSMiddleware,
@@ -62,57 +123,59 @@ app.add_middleware(
 
 
 # ── Health Check ──
+# Liveness probes hit this constantly, so the payload is built once and only
+# the timestamp is refreshed, at most once per second.
+_health_payload = {
+    "status": "healthy",
+    "timestamp": None,
+    "agents": ["vision", "climate", "satellite", "orchestrator"],
+}
+_health_ts = [0, None]
+
+
+def _health_timestamp() -> datetime:
+    now = int(time.time())
+    if now != _health_ts[0]:
+        _health_ts[0] = now
+        _health_ts[1] = datetime.fromtimestamp(now)
+    return _health_ts[1]
+
+
 @app.get("/api/health")
 async def health():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "agents": ["vision", "climate", "satellite", "orchestrator"],
-    }
+    _health_payload["timestamp"] = _health_timestamp()
+    return _health_payload
 
 
 # ── Farmer Profile ──
+FARMER_CACHE_SIZE = 4096
+FARMER_CACHE_TTL  = 300
+
+
+@alru_cache(maxsize=FARMER_CACHE_SIZE, ttl=FARMER_CACHE_TTL)
+async def _load_farmer(farmer_id: str) -> FarmerProfileResponse | None:
+    """Load a farmer profile, cached by id (invalidated on save)."""
+    async with SessionLocal() as db:
+        result = await db.execute(select(FarmerProfile).where(FarmerProfile.id == farmer_id))
+        farmer = result.scalar_one_or_none()
+        return FarmerProfileResponse.model_validate(farmer) if farmer else None
+
+
 @app.post("/api/farmer/profile")
-async def save_farmer_profile(profile: FarmerProfileCreate):
+async def save_farmer_profile(profile: FarmerProfileCreate, db: AsyncSession = Depends(get_db)):
     """Save or create a farmer profile from onboarding data."""
     try:
-        db = SessionLocal()
-        try:
-            farmer = FarmerProfile(
-                farmer_type=profile.farmer_type,
-                full_name=profile.full_name,
-                mobile=profile.mobile,
-                location=profile.location,
-                district=profile.district,
-                state=profile.state,
-                land_size=profile.land_size,
-                soil_type=profile.soil_type,
-                available_capital=profile.available_capital,
-                has_loan_access=profile.has_loan_access,
-                has_subsidy_access=profile.has_subsidy_access,
-                has_irrigation=profile.has_irrigation,
-                irrigation_type=profile.irrigation_type,
-                has_storage=profile.has_storage,
-                storage_capacity_tons=profile.storage_capacity_tons,
-                current_crops=profile.current_crops,
-                interested_crops=profile.interested_crops,
-                technology_interest=profile.technology_interest,
-                yearly_yield_tons=profile.yearly_yield_tons,
-                selling_markets=profile.selling_markets,
-                primary_commodity=profile.primary_commodity,
-                primary_region=profile.primary_region,
-                time_commitment=profile.time_commitment,
-                no_land_option=profile.no_land_option,
-                has_land=profile.has_land,
-                onboarding_completed=True,
-                profile_completeness=100.0,
-            )
-            db.add(farmer)
-            db.commit()
-            db.refresh(farmer)
-            return {"id": farmer.id, "status": "created"}
-        finally:
-            db.close()
+        # Single INSERT ... RETURNING round-trip instead of ORM add/flush/refresh
+        stmt = (
+            insert(FarmerProfile)
+            .values(**profile.model_dump(), onboarding_completed=True, profile_completeness=100.0)
+            .returning(FarmerProfile.id)
+        )
+        result = await db.execute(stmt)
+        new_id = result.scalar_one()
+        await db.commit()
+        _load_farmer.cache_invalidate(new_id)
+        return {"id": new_id, "status": "created"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Profile save failed: {str(e)}")
 
@@ -121,20 +184,66 @@ async def save_farmer_profile(profile: FarmerProfileCreate):
 async def get_farmer_profile(farmer_id: str):
     """Get a farmer profile by ID."""
     try:
-        db = SessionLocal()
-        try:
-            farmer = db.query(FarmerProfile).filter(FarmerProfile.id == farmer_id).first()
-            if not farmer:
-                raise HTTPException(status_code=404, detail="Farmer not found")
-            return FarmerProfileResponse.model_validate(farmer)
-        finally:
-            db.close()
+        farmer = await _load_farmer(farmer_id)
+        if not farmer:
+            raise HTTPException(status_code=404, detail="Farmer not found")
+        return farmer
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Profile fetch failed: {str(e)}")
 
 
+# ── Shared market summary (dashboard + intelligence) ──
+async def _build_market_summary(region: str, commodity: str, days: int) -> dict:
+    """
+    Price card, signals, recommendation and chart for one (region, commodity, days).
+    Cached briefly so concurrent identical requests share one computation;
+    callers must not mutate the returned dicts. Failed lookups (error status
+    or empty series) are returned but never kept in the cache.
+    """
+    market = await _cached_market_summary(region, commodity, days)
+    if market["failed"]:
+        _cached_market_summary.cache_invalidate(region, commodity, days)
+    return market
+
+
+@alru_cache(maxsize=256, ttl=60)
+async def _cached_market_summary(region: str, commodity: str, days: int) -> dict:
+    raw, series = await asyncio.gather(
+        get_market_data(region, commodity),
+        get_price_trend_series(region, commodity, days=days),
+    )
+    enriched       = enrich_market_data(raw, series)
+    momentum       = compute_price_momentum(series)
+    enriched["momentum"] = momentum
+    recommendation = compute_trade_recommendation(
+        trend        = enriched.get("trend", "stable"),
+        buyer_signal = enriched.get("buyer_signal", "Stable"),
+        momentum     = momentum.get("momentum", "neutral"),
+    )
+    return {
+        "summary":        to_market_summary(enriched, recommendation),
+        "chart":          to_chart_series(series),
+        "recommendation": recommendation,
+        "risk_level":     enriched.get("risk_level", "Moderate"),
+        "failed":         raw.get("status") == "error" or not series,
+    }
+
+
+# Last (region, commodity) resolved per farmer, used to start the dashboard's
+# market fetch before the profile query returns. Bounded like the profile cache.
+_dashboard_market_hint: TTLCache = TTLCache(maxsize=FARMER_CACHE_SIZE, ttl=FARMER_CACHE_TTL)
+
+
+def _discard(task: asyncio.Future | None) -> None:
+    """Cancel an unneeded speculative task and retrieve its outcome so errors aren't logged."""
+    if task is None:
+        return
+    task.cancel()
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
 @app.get("/api/farmer/dashboard/{farmer_id}")
 async def farmer_dashboard(farmer_id: str):
     """
@@ -142,34 +251,31 @@ async def farmer_dashboard(farmer_id: str):
     Returns market intelligence tailored to the farmer's onboarding choices.
     """
     try:
-        # 1. Load farmer profile
-        db = SessionLocal()
+        # 1. Load farmer profile, overlapping the query with a market fetch for
+        #    the region/commodity this farmer resolved to on their last visit
+        hint = _dashboard_market_hint.get(farmer_id)
+        speculative = asyncio.ensure_future(_build_market_summary(*hint, 14)) if hint else None
         try:
-            farmer = db.query(FarmerProfile).filter(FarmerProfile.id == farmer_id).first()
-            if not farmer:
-                raise HTTPException(status_code=404, detail="Farmer not found")
-        finally:
-            db.close()
+            farmer = await _load_farmer(farmer_id)
+        except BaseException:
+            _discard(speculative)
+            raise
+        if not farmer:
+            _discard(speculative)
+            _dashboard_market_hint.pop(farmer_id, None)
+            raise HTTPException(status_code=404, detail="Farmer not found")
 
         # 2. Use farmer preferences to query market data
         region = farmer.primary_region or "Kerala_Kottayam"
         commodity = farmer.primary_commodity or "Banana"
+        _dashboard_market_hint[farmer_id] = (region, commodity)
 
-        import asyncio
-        raw, series = await asyncio.gather(
-            get_market_data(region, commodity),
-            get_price_trend_series(region, commodity, days=14),
-        )
-        from domains.market.market_signals import compute_price_momentum
-        enriched = enrich_market_data(raw, series)
-        momentum = compute_price_momentum(series)
-        enriched["momentum"] = momentum
-        recommendation = compute_trade_recommendation(
-            trend=enriched.get("trend", "stable"),
-            buyer_signal=enriched.get("buyer_signal", "Stable"),
-            momentum=momentum.get("momentum", "neutral"),
-        )
-        summary = to_market_summary(enriched, recommendation)
+        if hint == (region, commodity):
+            market = await speculative
+        else:
+            _discard(speculative)
+            market = await _build_market_summary(region, commodity, 14)
+        recommendation = market["recommendation"]
 
         return {
             "farmer": {
@@ -180,11 +286,11 @@ async def farmer_dashboard(farmer_id: str):
                 "land_size": farmer.land_size,
                 "available_capital": farmer.available_capital,
             },
-            "market": summary,
+            "market": market["summary"],
             "ai_recommendation": recommendation.get("action", "HOLD"),
             "recommendation_reason": recommendation.get("reason", ""),
             "consensus_score": recommendation.get("confidence", 70),
-            "risk_level": enriched.get("risk_level", "Moderate"),
+            "risk_level": market["risk_level"],
         }
     except HTTPException:
         raise
@@ -193,15 +299,26 @@ async def farmer_dashboard(farmer_id: str):
 
 
 # ── Vision Detection Agent ──
+@lru_cache(maxsize=1)
+def _vision_analyzer():
+    """Import the vision agent (torch + transformers) on first use rather than at startup."""
+    from agents.vision_agent import analyze_image
+    return analyze_image
+
+
 @app.post("/api/vision/analyze")
 async def vision_analyze(file: UploadFile = File(...)):
     """Upload a plant leaf image for disease classification."""
     if not file.content_type or not file.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="File must be an image (JPEG, PNG, etc.)")
+    # Backstop for uploads without a Content-Length (e.g. chunked)
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail="Image exceeds the 10 MB upload limit")
 
     try:
-        image_bytes = await file.read()
-        result = await analyze_image(image_bytes)
+        analyze_image = await asyncio.to_thread(_vision_analyzer)
+        # Hand PIL the spooled upload directly instead of copying it into bytes
+        result = await analyze_image(file.file)
         return result
     except ValueError as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -256,7 +373,7 @@ async def orchestrate(agent_input: AgentInput):
 async def market_filters():
     """Return topology (State->District) and commodities from CSV filenames."""
     try:
-        return get_available_filters()
+        return await asyncio.to_thread(get_available_filters)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Filter discovery failed: {str(e)}")
 
@@ -272,25 +389,9 @@ async def market_intelligence(
     Full market intelligence: price card + trend chart + trade recommendation.
     Powered by uploaded CSV files (backend/data/*.csv).
     """
-    import asyncio
     try:
-        raw, series = await asyncio.gather(
-            get_market_data(region, commodity),
-            get_price_trend_series(region, commodity, days=days),
-        )
-        from domains.market.market_signals import compute_price_momentum
-        enriched       = enrich_market_data(raw, series)
-        momentum       = compute_price_momentum(series)
-        enriched["momentum"] = momentum
-        recommendation = compute_trade_recommendation(
-            trend        = enriched.get("trend", "stable"),
-            buyer_signal = enriched.get("buyer_signal", "Stable"),
-            momentum     = momentum.get("momentum", "neutral"),
-        )
-        chart   = to_chart_series(series)
-        summary = to_market_summary(enriched, recommendation)
-        summary["chart"] = chart
-        return summary
+        market = await _build_market_summary(region, commodity, days)
+        return {**market["summary"], "chart": market["chart"]}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Market intelligence failed: {str(e)}")
 
@@ -305,7 +406,7 @@ async def market_records(
 ):
     """Paginated individual records for the data table."""
     try:
-        return get_market_records(region, commodity, page, page_size)
+        return await asyncio.to_thread(get_market_records, region, commodity, page, page_size)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Market records fetch failed: {str(e)}")
 
@@ -325,60 +426,83 @@ async def market_data(
 
 # ── AI Assistant Chat ──
 from pydantic import BaseModel
-from typing import List
+from typing import List, Literal
 
 class ChatMessage(BaseModel):
-    role: str
+    role: Literal["user", "assistant", "system"]
     content: str
 
 class ChatRequest(BaseModel):
     messages: List[ChatMessage]
 
+ASSISTANT_SYSTEM_PROMPT = (
+    "You are an expert AI agricultural assistant for Indian farmers. "
+    "You provide advice on crop diseases, mandi prices, selling strategies, "
+    "crop planning, weather risks, and government schemes. "
+    "Keep answers concise, practical, and actionable. "
+    "Use bullet points for lists. "
+    "If asked about prices, mention typical mandi ranges. "
+    "Support questions in English, Hindi, and Tamil. "
+    "Always be encouraging and supportive of farmers."
+)
+_SYSTEM_MSG = {"role": "system", "content": ASSISTANT_SYSTEM_PROMPT}
+# Client-supplied system messages are dropped; only the prompt above is sent
+_ALLOWED_ROLES = frozenset({"user", "assistant"})
+
 @app.post("/api/assistant/chat")
 async def assistant_chat(req: ChatRequest):
-    """AI farming assistant powered by Groq LLM."""
-    from config import GROQ_API_KEY, GROQ_MODEL
-    import httpx
-
-    if not GROQ_API_KEY:
+    """AI farming assistant powered by Groq LLM, streamed as server-sent events."""
+    if not app.state.groq:
         raise HTTPException(status_code=500, detail="GROQ_API_KEY is not configured")
 
-    system_prompt = (
-        "You are an expert AI agricultural assistant for Indian farmers. "
-        "You provide advice on crop diseases, mandi prices, selling strategies, "
-        "crop planning, weather risks, and government schemes. "
-        "Keep answers concise, practical, and actionable. "
-        "Use bullet points for lists. "
-        "If asked about prices, mention typical mandi ranges. "
-        "Support questions in English, Hindi, and Tamil. "
-        "Always be encouraging and supportive of farmers."
+    groq_messages = [
+        _SYSTEM_MSG,
+        *({"role": m.role, "content": m.content} for m in req.messages if m.role in _ALLOWED_ROLES),
+    ]
+
+    request = app.state.groq.build_request(
+        "POST",
+        "/openai/v1/chat/completions",
+        json={
+            "model": GROQ_MODEL,
+            "messages": groq_messages,
+            "temperature": 0.7,
+            "max_tokens": 1024,
+            "stream": True,
+        },
     )
-
-    groq_messages = [{"role": "system", "content": system_prompt}]
-    for m in req.messages:
-        if m.role in ("user", "assistant"):
-            groq_messages.append({"role": m.role, "content": m.content})
-
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.post(
-                "https://api.groq.com/openai/v1/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {GROQ_API_KEY}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": GROQ_MODEL,
-                    "messages": groq_messages,
-                    "temperature": 0.7,
-                    "max_tokens": 1024,
-                },
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            reply = data["choices"][0]["message"]["content"]
-            return {"reply": reply}
-    except httpx.HTTPStatusError as e:
-        raise HTTPException(status_code=502, detail=f"Groq API error: {e.response.text}")
+        resp = await app.state.groq.send(request, stream=True)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
+
+    if resp.is_error:
+        await resp.aread()
+        await resp.aclose()
+        raise HTTPException(status_code=502, detail=f"Groq API error: {resp.text}")
+
+    async def relay():
+        # Re-emit Groq's SSE lines as they arrive so the client renders tokens immediately
+        try:
+            async for line in resp.aiter_lines():
+                yield line + "\n"
+        finally:
+            await resp.aclose()
+
+    return StreamingResponse(relay(), media_type="text/event-stream")
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+    import uvicorn
+
+    # uvloop has no Windows build; fall back to the stdlib loop there
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=max(2, os.cpu_count() or 1),
+    )
@@ -6,6 +6,7 @@ from typing import Optional
 
 
 class FarmerProfileCreate(BaseModel):
+    # Field names must match FarmerProfile columns: the save endpoint inserts model_dump() as-is.
     farmer_type: str = "new_farmer"
     full_name: str = ""
     mobile: str = ""
@@ -0,0 +1,17 @@
+"""
+Optional Numba JIT decorator.
+Re-exports numba.njit when installed, otherwise a no-op so decorated
+functions run as plain Python.
+"""
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    def njit(*args, **kwargs):
+        # Support both @njit and @njit(cache=True)
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn):
+            return fn
+        return decorator
@@ -26,8 +26,8 @@ const WELCOME_MSG = {
     timestamp: new Date().toISOString(),
 };
 
-// ── API call ──
-async function sendChatMessage(messages) {
+// ── API call (streams server-sent events, calling onDelta with the reply so far) ──
+async function sendChatMessage(messages, onDelta) {
     const res = await fetch(`${API_BASE}/api/assistant/chat`, {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
@@ -39,7 +39,44 @@ async function sendChatMessage(messages) {
         const err = await res.json().catch(() => ({ detail: 'Chat request failed' }));
         throw new Error(err.detail || 'Chat request failed');
     }
-    return res.json();
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let reply = '';
+    let finished = false;
+    while (!finished) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop();
+        for (const line of lines) {
+            if (!line.startsWith('data:')) continue;
+            const payload = line.slice(5).trim();
+            if (payload === '[DONE]') {
+                finished = true;
+                break;
+            }
+            let frame;
+            try {
+                frame = JSON.parse(payload);
+            } catch {
+                continue; // Ignore malformed / partial frames
+            }
+            if (frame.error) {
+                // Groq reports some failures as an error frame after the 200
+                throw new Error(frame.error.message || 'Chat stream failed');
+            }
+            const delta = frame.choices?.[0]?.delta?.content;
+            if (delta) {
+                reply += delta;
+                onDelta(reply);
+            }
+        }
+    }
+    if (!reply) throw new Error('Empty reply from assistant');
+    return reply;
 }
 
 // ── Markdown-lite renderer (bold, italic, lists, code) ──
@@ -95,6 +132,7 @@ export default function AIAssistantPanel() {
     const [messages, setMessages] = useState([{ ...WELCOME_MSG }]);
     const [input, setInput] = useState('');
     const [loading, setLoading] = useState(false);
+    const [streaming, setStreaming] = useState(false);
     const [error, setError] = useState(null);
     const scrollRef = useRef(null);
     const inputRef = useRef(null);
@@ -117,24 +155,35 @@ export default function AIAssistantPanel() {
         setError(null);
         setLoading(true);
 
+        let started = false;
+        const onDelta = (reply) => {
+            if (!started) {
+                started = true;
+                setStreaming(true);
+                setMessages(prev => [
+                    ...prev,
+                    { role: 'assistant', content: reply, timestamp: new Date().toISOString() },
+                ]);
+            } else {
+                setMessages(prev => [...prev.slice(0, -1), { ...prev[prev.length - 1], content: reply }]);
+            }
+        };
+
         try {
-            const result = await sendChatMessage(newMessages);
-            setMessages(prev => [
-                ...prev,
-                { role: 'assistant', content: result.reply, timestamp: new Date().toISOString() },
-            ]);
+            await sendChatMessage(newMessages, onDelta);
         } catch (err) {
             setError(err.message);
-            setMessages(prev => [
-                ...prev,
-                {
-                    role: 'assistant',
-                    content: '⚠️ Sorry, I couldn\'t process your request right now. Please check that the backend is running and your Gemini API key is configured.',
-                    timestamp: new Date().toISOString(),
-                },
-            ]);
+            const errorMsg = {
+                role: 'assistant',
+                content: '⚠️ Sorry, I couldn\'t process your request right now. Please check that the backend is running and your Gemini API key is configured.',
+                timestamp: new Date().toISOString(),
+            };
+            // A stream that failed mid-reply replaces its partial bubble, so the
+            // truncated text isn't shown or sent back as history next turn
+            setMessages(prev => (started ? [...prev.slice(0, -1), errorMsg] : [...prev, errorMsg]));
         } finally {
             setLoading(false);
+            setStreaming(false);
             inputRef.current?.focus();
         }
     }, [input, messages, loading]);
@@ -178,7 +227,7 @@ export default function AIAssistantPanel() {
                 {messages.map((m, i) => (
                     <MessageBubble key={i} msg={m} />
                 ))}
-                {loading && <TypingIndicator />}
+                {loading && !streaming && <TypingIndicator />}
             </div>
 
             {/* ── Error Banner ── */}